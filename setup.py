@@ -54,6 +54,8 @@ setup(
             "graphene",
             "itsdangerous",
             "jinja2",
+            "minijinja>=2.8.0; python_version >= '3.8'",
+            "orjson",
             "python-multipart",
             "pyyaml",
             "requests",
@@ -8,6 +8,9 @@ from starlette.middleware.errors import ServerErrorMiddleware
 from starlette.routing import BaseRoute, Router
 from starlette.types import ASGIApp, Receive, Scope, Send
 
+# Exception handler keys that are routed to `ServerErrorMiddleware`.
+ERROR_HANDLER_KEYS = frozenset({500, Exception})
+
 
 class Starlette:
     """
@@ -61,7 +64,7 @@ class Starlette:
         exception_handlers = {}
 
         for key, value in self.exception_handlers.items():
-            if key in (500, Exception):
+            if key in ERROR_HANDLER_KEYS:
                 error_handler = value
             else:
                 exception_handlers[key] = value
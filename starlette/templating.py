@@ -1,16 +1,73 @@
+import importlib.util
+import json
 import typing
 
 from starlette.background import BackgroundTask
-from starlette.responses import Response
+from starlette.responses import Response, StreamingResponse
 from starlette.types import Receive, Scope, Send
 
-try:
+if typing.TYPE_CHECKING:  # pragma: nocover
     import jinja2
-except ImportError:  # pragma: nocover
-    jinja2 = None  # type: ignore
+    import minijinja
 
 
-class _TemplateResponse(Response):
+# The same replacements that markupsafe, and so Jinja2, uses for escaping.
+HTML_ESCAPES = str.maketrans(
+    {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&#34;", "'": "&#39;"}
+)
+
+
+def _url_for(context: dict, name: str, **path_params: typing.Any) -> str:
+    request = context["request"]
+    return request.url_for(name, **path_params)
+
+
+def _minijinja_url_for(state: typing.Any, name: str, **path_params: typing.Any) -> str:
+    # MiniJinja's own escaping also escapes "/", so escape the URL with
+    # Jinja2's replacements instead and mark it as safe.
+    import minijinja
+
+    request = state.lookup("request")
+    url = request.url_for(name, **path_params)
+    return minijinja.safe(url.translate(HTML_ESCAPES))
+
+
+def _orjson_dumps(obj: typing.Any, **kwargs: typing.Any) -> str:
+    # Used by the `tojson` filter. Jinja2 still applies its HTML-safe
+    # escaping to the result. Fall back to the standard library only for
+    # options that orjson doesn't support, such as `indent`.
+    import orjson
+
+    if not set(kwargs) <= {"sort_keys"}:
+        return json.dumps(obj, **kwargs)
+    option = orjson.OPT_NON_STR_KEYS
+    if kwargs.get("sort_keys"):
+        option |= orjson.OPT_SORT_KEYS
+    return orjson.dumps(obj, option=option).decode("utf-8")
+
+
+class _TemplateResponseMixin:
+    """
+    Sends the template and context to the test client before the response.
+    """
+
+    template = None  # type: typing.Any
+    context = None  # type: typing.Any
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        extensions = scope.get("extensions", ())
+        if "http.response.template" in extensions:
+            await send(
+                {
+                    "type": "http.response.template",
+                    "template": self.template,
+                    "context": self.context,
+                }
+            )
+        await super().__call__(scope, receive, send)  # type: ignore
+
+
+class _TemplateResponse(_TemplateResponseMixin, Response):
     media_type = "text/html"
 
     def __init__(
@@ -27,46 +84,130 @@ class _TemplateResponse(Response):
         content = template.render(context)
         super().__init__(content, status_code, headers, media_type, background)
 
-    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
-        request = self.context.get("request", {})
-        extensions = request.get("extensions", {})
-        if "http.response.template" in extensions:
-            await send(
-                {
-                    "type": "http.response.template",
-                    "template": self.template,
-                    "context": self.context,
-                }
-            )
-        await super().__call__(scope, receive, send)
+
+class _TemplateStreamingResponse(_TemplateResponseMixin, StreamingResponse):
+    media_type = "text/html"
+    chunk_size = 8192
+
+    def __init__(
+        self,
+        template: typing.Any,
+        context: dict,
+        status_code: int = 200,
+        headers: dict = None,
+        media_type: str = None,
+        background: BackgroundTask = None,
+    ):
+        self.template = template
+        self.context = context
+        content = self.generate()
+        super().__init__(content, status_code, headers, media_type, background)
+
+    def generate(self) -> typing.Iterator[str]:
+        # Jinja2 yields many small fragments, so buffer them into larger
+        # chunks before each one is sent.
+        chunk = []  # type: typing.List[str]
+        size = 0
+        for fragment in self.template.generate(self.context):
+            chunk.append(fragment)
+            size += len(fragment)
+            if size >= self.chunk_size:
+                yield "".join(chunk)
+                chunk = []
+                size = 0
+        if chunk:
+            yield "".join(chunk)
+
+
+class BaseTemplates:
+    """
+    A base class for template engines. Subclasses provide `get_env()` and
+    `get_template()`.
+    """
+
+    def __init__(self, directory: str, **env_options: typing.Any) -> None:
+        self.env = self.get_env(directory, **env_options)
+
+    def get_env(self, directory: str, **env_options: typing.Any) -> typing.Any:
+        raise NotImplementedError()  # pragma: no cover
+
+    def get_template(self, name: str) -> typing.Any:
+        raise NotImplementedError()  # pragma: no cover
+
+    def TemplateResponse(
+        self,
+        name: str,
+        context: dict,
+        status_code: int = 200,
+        headers: dict = None,
+        media_type: str = None,
+        background: BackgroundTask = None,
+    ) -> _TemplateResponse:
+        template = self._get_context_template(name, context)
+        return _TemplateResponse(
+            template,
+            context,
+            status_code=status_code,
+            headers=headers,
+            media_type=media_type,
+            background=background,
+        )
+
+    def _get_context_template(self, name: str, context: dict) -> typing.Any:
+        if "request" not in context:
+            raise ValueError('context must include a "request" key')
+        return self.get_template(name)
 
 
-class Jinja2Templates:
+class Jinja2Templates(BaseTemplates):
     """
     templates = Jinja2Templates("templates")
 
     return templates.TemplateResponse("index.html", {"request": request})
+
+    Set `use_orjson=True` to serialize values in the `tojson` filter with orjson.
+
+    Any additional keyword arguments are passed through to `jinja2.Environment`.
     """
 
-    def __init__(self, directory: str) -> None:
-        assert jinja2 is not None, "jinja2 must be installed to use Jinja2Templates"
-        self.env = self.get_env(directory)
+    def __init__(
+        self, directory: str, use_orjson: bool = False, **env_options: typing.Any
+    ) -> None:
+        # The template engines are imported lazily, so that importing this
+        # module doesn't pay for an engine that isn't used.
+        assert (
+            importlib.util.find_spec("jinja2") is not None
+        ), "jinja2 must be installed to use Jinja2Templates"
+        assert (
+            not use_orjson or importlib.util.find_spec("orjson") is not None
+        ), "orjson must be installed to use use_orjson=True"
+        assert not env_options.get(
+            "enable_async"
+        ), "Jinja2Templates renders synchronously and does not support enable_async"
+        self.use_orjson = use_orjson
+        super().__init__(directory, **env_options)
 
-    def get_env(self, directory: str) -> "jinja2.Environment":
-        @jinja2.contextfunction
-        def url_for(context: dict, name: str, **path_params: typing.Any) -> str:
-            request = context["request"]
-            return request.url_for(name, **path_params)
+    def get_env(
+        self, directory: str, **env_options: typing.Any
+    ) -> "jinja2.Environment":
+        import jinja2
 
-        loader = jinja2.FileSystemLoader(directory)
-        env = jinja2.Environment(loader=loader, autoescape=True)
-        env.globals["url_for"] = url_for
+        # `contextfunction` was renamed to `pass_context` in Jinja2 3.0.
+        pass_context = getattr(jinja2, "pass_context", None) or jinja2.contextfunction
+        env_options.setdefault("loader", jinja2.FileSystemLoader(directory))
+        env_options.setdefault("autoescape", True)
+        env = jinja2.Environment(**env_options)
+        # Marking the function only sets an attribute on it, so every
+        # environment shares the same module-level `url_for`.
+        env.globals["url_for"] = pass_context(_url_for)
+        if self.use_orjson:
+            env.policies["json.dumps_function"] = _orjson_dumps
         return env
 
     def get_template(self, name: str) -> "jinja2.Template":
         return self.env.get_template(name)
 
-    def TemplateResponse(
+    def TemplateStreamingResponse(
         self,
         name: str,
         context: dict,
@@ -74,11 +215,9 @@ class Jinja2Templates:
         headers: dict = None,
         media_type: str = None,
         background: BackgroundTask = None,
-    ) -> _TemplateResponse:
-        if "request" not in context:
-            raise ValueError('context must include a "request" key')
-        template = self.get_template(name)
-        return _TemplateResponse(
+    ) -> _TemplateStreamingResponse:
+        template = self._get_context_template(name, context)
+        return _TemplateStreamingResponse(
             template,
             context,
             status_code=status_code,
@@ -86,3 +225,47 @@ class Jinja2Templates:
             media_type=media_type,
             background=background,
         )
+
+
+class _MiniJinjaTemplate:
+    """
+    Adapts a named MiniJinja template to the `render(context)` interface
+    that `_TemplateResponse` expects.
+    """
+
+    def __init__(self, env: "minijinja.Environment", name: str) -> None:
+        self.env = env
+        self.name = name
+
+    def render(self, context: dict) -> str:
+        return self.env.render_template(self.name, **context)
+
+
+class MiniJinjaTemplates(BaseTemplates):
+    """
+    templates = MiniJinjaTemplates("templates")
+
+    return templates.TemplateResponse("index.html", {"request": request})
+
+    Any additional keyword arguments are passed through to `minijinja.Environment`.
+    """
+
+    def __init__(self, directory: str, **env_options: typing.Any) -> None:
+        assert (
+            importlib.util.find_spec("minijinja") is not None
+        ), "minijinja must be installed to use MiniJinjaTemplates"
+        super().__init__(directory, **env_options)
+
+    def get_env(
+        self, directory: str, **env_options: typing.Any
+    ) -> "minijinja.Environment":
+        import minijinja
+
+        env_options.setdefault("loader", minijinja.load_from_path(directory))
+        env_options.setdefault("auto_escape_callback", lambda name: True)
+        env = minijinja.Environment(**env_options)
+        env.add_global("url_for", minijinja.pass_state(_minijinja_url_for))
+        return env
+
+    def get_template(self, name: str) -> _MiniJinjaTemplate:
+        return _MiniJinjaTemplate(self.env, name)
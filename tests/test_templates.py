@@ -1,9 +1,11 @@
+import datetime
 import os
 
+import jinja2
 import pytest
 
 from starlette.applications import Starlette
-from starlette.templating import Jinja2Templates
+from starlette.templating import Jinja2Templates, MiniJinjaTemplates
 from starlette.testclient import TestClient
 
 
@@ -30,3 +32,150 @@ def test_template_response_requires_request(tmpdir):
     templates = Jinja2Templates(str(tmpdir))
     with pytest.raises(ValueError):
         templates.TemplateResponse(None, {})
+
+
+def test_template_streaming_response(tmpdir):
+    path = os.path.join(tmpdir, "index.html")
+    with open(path, "w") as file:
+        file.write("<ul>{% for item in items %}<li>{{ item }}</li>{% endfor %}</ul>")
+
+    app = Starlette(debug=True)
+    templates = Jinja2Templates(directory=str(tmpdir))
+    items = ["x" * 1000 for _ in range(20)]
+
+    @app.route("/")
+    async def homepage(request):
+        context = {"request": request, "items": items}
+        return templates.TemplateStreamingResponse("index.html", context)
+
+    client = TestClient(app)
+    response = client.get("/")
+    expected = "<ul>" + "".join(f"<li>{item}</li>" for item in items) + "</ul>"
+    assert response.text == expected
+    assert "content-length" not in response.headers
+    assert response.headers["content-type"] == "text/html; charset=utf-8"
+    assert response.template.name == "index.html"
+    assert set(response.context.keys()) == {"request", "items"}
+
+
+def test_template_streaming_response_requires_request(tmpdir):
+    templates = Jinja2Templates(str(tmpdir))
+    with pytest.raises(ValueError):
+        templates.TemplateStreamingResponse(None, {})
+
+
+def test_templates_with_env_options(tmpdir):
+    templates = Jinja2Templates(str(tmpdir), auto_reload=False, autoescape=False)
+    assert templates.env.auto_reload is False
+    assert templates.env.autoescape is False
+    assert isinstance(templates.env.loader, jinja2.FileSystemLoader)
+
+
+def test_templates_reject_enable_async(tmpdir):
+    with pytest.raises(AssertionError):
+        Jinja2Templates(str(tmpdir), enable_async=True)
+
+
+def test_minijinja_templates(tmpdir):
+    pytest.importorskip("minijinja")
+    path = os.path.join(tmpdir, "index.html")
+    with open(path, "w") as file:
+        file.write(
+            "<html>Hello, <a href='{{ url_for('homepage') }}'>{{ name }}</a></html>"
+        )
+
+    app = Starlette(debug=True)
+    templates = MiniJinjaTemplates(directory=str(tmpdir))
+
+    @app.route("/")
+    async def homepage(request):
+        context = {"request": request, "name": "<world>"}
+        return templates.TemplateResponse("index.html", context)
+
+    client = TestClient(app)
+    response = client.get("/")
+    assert (
+        response.text
+        == "<html>Hello, <a href='http://testserver/'>&lt;world&gt;</a></html>"
+    )
+    assert response.template.name == "index.html"
+    assert set(response.context.keys()) == {"request", "name"}
+
+
+def test_minijinja_url_for_matches_jinja2(tmpdir):
+    pytest.importorskip("minijinja")
+    path = os.path.join(tmpdir, "index.html")
+    with open(path, "w") as file:
+        file.write("<a href='{{ url_for('user', username=username) }}'></a>")
+
+    app = Starlette()
+    jinja2_templates = Jinja2Templates(directory=str(tmpdir))
+    minijinja_templates = MiniJinjaTemplates(directory=str(tmpdir))
+
+    @app.route("/jinja2/{username}")
+    async def jinja2_user(request):
+        context = {"request": request, "username": "<a&b 'c\"d>"}
+        return jinja2_templates.TemplateResponse("index.html", context)
+
+    @app.route("/users/{username}", name="user")
+    async def minijinja_user(request):
+        context = {"request": request, "username": "<a&b 'c\"d>"}
+        return minijinja_templates.TemplateResponse("index.html", context)
+
+    client = TestClient(app)
+    expected = client.get("/jinja2/x").text
+    assert "&#39;c&#34;d&gt;" in expected
+    assert client.get("/users/x").text == expected
+
+
+def test_minijinja_template_response_requires_request(tmpdir):
+    pytest.importorskip("minijinja")
+    templates = MiniJinjaTemplates(str(tmpdir))
+    with pytest.raises(ValueError):
+        templates.TemplateResponse(None, {})
+
+
+def test_templates_share_url_for(tmpdir):
+    first = Jinja2Templates(str(tmpdir))
+    second = Jinja2Templates(str(tmpdir))
+    assert first.env.globals["url_for"] is second.env.globals["url_for"]
+
+
+def test_templates_tojson(tmpdir):
+    path = os.path.join(tmpdir, "index.html")
+    with open(path, "w") as file:
+        file.write("<script>var data = {{ data|tojson }};</script>")
+
+    templates = Jinja2Templates(directory=str(tmpdir))
+    template = templates.get_template("index.html")
+    data = {"b": "</script>", "a": [1, 2]}
+    assert template.render(data=data) == (
+        '<script>var data = {"a": [1, 2], "b": "\\u003c/script\\u003e"};</script>'
+    )
+
+
+def test_templates_tojson_with_orjson(tmpdir):
+    path = os.path.join(tmpdir, "index.html")
+    with open(path, "w") as file:
+        file.write("<script>var data = {{ data|tojson }};</script>")
+
+    templates = Jinja2Templates(directory=str(tmpdir), use_orjson=True)
+    template = templates.get_template("index.html")
+    data = {"b": "</script>", "a": [1, 2]}
+    assert template.render(data=data) == (
+        '<script>var data = {"a":[1,2],"b":"\\u003c/script\\u003e"};</script>'
+    )
+    # Non-string keys and natively supported types can be mixed.
+    data = {"when": datetime.date(2020, 1, 1), 1: "x"}
+    assert template.render(data=data) == (
+        '<script>var data = {"1":"x","when":"2020-01-01"};</script>'
+    )
+    # Values that orjson can't serialize raise, rather than falling back.
+    with pytest.raises(TypeError):
+        template.render(data={"when": datetime.date(2020, 1, 1), "n": 2 ** 70})
+    # Options orjson doesn't support fall back to the json module.
+    path = os.path.join(tmpdir, "indent.html")
+    with open(path, "w") as file:
+        file.write("{{ data|tojson(indent=1) }}")
+    template = templates.get_template("indent.html")
+    assert template.render(data=[1]) == "[\n 1\n]"